@@ -1,18 +1,106 @@
 import asyncio
-import re
+import collections
 import logging
-
-# Maintain compat with various 3.x async changes
-if hasattr(asyncio, 'ensure_future'):
-    ensure_future = asyncio.ensure_future
-else:
-    ensure_future = getattr(asyncio, 'async')
+import sys
 
 logger = logging.getLogger('russound')
 
-_re_response = re.compile(
-        r"(?:(?:S\[(?P<source>\d+)\])|(?:C\[(?P<controller>\d+)\]"
-        r".Z\[(?P<zone>\d+)\]))\.(?P<variable>\S+)=\"(?P<value>.*)\"")
+# Bound templates for the commands sent to the controller
+_cmd_set = 'SET {}.{}="{}"'.format
+_cmd_get = 'GET {}.{}'.format
+_cmd_watch_on = 'WATCH {} ON'.format
+_cmd_watch_off = 'WATCH {} OFF'.format
+_cmd_event = 'EVENT {}!{} {}'.format
+_cmd_set_source = 'SET S[{}].{}="{}"'.format
+_cmd_get_source = 'GET S[{}].{}'.format
+_cmd_watch_source_on = 'WATCH S[{}] ON'.format
+_cmd_watch_source_off = 'WATCH S[{}] OFF'.format
+
+_name_cache = {}
+_wire_name_cache = {}
+
+# Controller, zone and source ids are small, so look them up instead of
+# parsing them
+_tiny_int = {str(i).encode('ascii'): i for i in range(256)}
+
+
+def _norm(name, _cache=_name_cache):
+    """
+    Return the lowercased, interned form of a variable name as used for the
+    cache keys.
+    """
+    r = _cache.get(name)
+    if r is None:
+        r = _cache.setdefault(name, sys.intern(name.lower()))
+    return r
+
+
+def _norm_wire(name, _cache=_wire_name_cache):
+    """
+    Same as _norm for a variable name parsed off the wire as bytes.
+    """
+    r = _cache.get(name)
+    if r is None:
+        r = _cache.setdefault(
+                name, _norm(name.decode('ascii', 'replace')))
+    return r
+
+
+def _parse_payload(payload):
+    """
+    Split the payload (as bytes) of a RIO response into its parts.
+
+    Returns a (kind, id, zone, variable, value) tuple where kind is 'S' for
+    source variables (zone is None) and 'C' for zone variables (id is the
+    controller). The variable name is left as bytes and the value is
+    decoded. Returns None if the payload is not a variable assignment.
+    """
+    if payload.startswith(b'S['):
+        end = payload.find(b']', 2)
+        if end < 0 or payload[end + 1:end + 2] != b'.':
+            return None
+        kind, zone, start = 'S', None, end + 2
+    elif payload.startswith(b'C['):
+        # Any character may separate the controller from the zone
+        end = payload.find(b']', 2)
+        if end < 0 or payload[end + 2:end + 4] != b'Z[':
+            return None
+        zend = payload.find(b']', end + 4)
+        if zend < 0 or payload[zend + 1:zend + 2] != b'.':
+            return None
+        kind, zone, start = 'C', payload[end + 4:zend], zend + 2
+    else:
+        return None
+
+    id_ = payload[2:end]
+    if not id_.isdigit() or (zone is not None and not zone.isdigit()):
+        return None
+
+    # The value runs to the last quote, anything after it is ignored. The
+    # variable name is the longest run of non-whitespace that is followed
+    # by '="'.
+    last = payload.rfind(b'"')
+    if last < 0:
+        return None
+    eq = payload.rfind(b'="', start + 1, last)
+    if eq < 0:
+        return None
+    variable = payload[start:eq]
+    if variable.split() != [variable]:
+        if payload[start:start + 1].isspace():
+            return None
+        ws = start + len(variable.split(None, 1)[0])
+        eq = payload.rfind(b'="', start + 1, ws)
+        if eq < 0:
+            return None
+        variable = payload[start:eq]
+
+    id_ = _tiny_int.get(id_) or int(id_)
+    if zone is not None:
+        zone = _tiny_int.get(zone) or int(zone)
+
+    return (kind, id_, zone, variable,
+            payload[eq + 2:last].decode('utf-8', 'replace'))
 
 
 class CommandException(Exception):
@@ -32,49 +120,118 @@ class ZoneID:
     Zones are identified by their zone index (1-N) within the controller they
     belong to and the controller index (1-N) within the entire system.
     """
+    _intern = {}
+
     def __init__(self, zone, controller=1):
-        self.zone = int(zone)
-        self.controller = int(controller)
+        if type(zone) is not int:
+            zone = int(zone)
+        if not 0 <= zone <= 255:
+            raise ValueError("Zone index out of range: %d" % zone)
+        self.zone = zone
+        if type(controller) is not int:
+            controller = int(controller)
+        self.controller = controller
+        self._key = (self.controller << 8) | self.zone
+        self._device_str = "C[%d].Z[%d]" % (self.controller, self.zone)
+
+    @classmethod
+    def get(cls, zone, controller=1):
+        """
+        Return a shared ZoneID for the zone, creating it on first use.
+        """
+        key = (controller, zone)
+        zone_id = cls._intern.get(key)
+        if zone_id is None:
+            zone_id = cls._intern.setdefault(key, cls(zone, controller))
+        return zone_id
 
     def __str__(self):
         return "%d:%d" % (self.controller, self.zone)
 
     def __eq__(self, other):
-        return hasattr(other, 'zone') and \
-                hasattr(other, 'controller') and \
+        return isinstance(other, ZoneID) and \
                 other.zone == self.zone and \
                 other.controller == self.controller
 
     def __hash__(self):
-        return hash(str(self))
+        return self._key
 
     def device_str(self):
         """
         Generate a string that can be used to reference this zone in a RIO
         command
         """
-        return "C[%d].Z[%d]" % (self.controller, self.zone)
+        return self._device_str
+
+
+class _RioProtocol(asyncio.Protocol):
+    """
+    Splits the byte stream from the controller into frames and hands each
+    one to the owning Russound object.
+    """
+    def __init__(self, russound):
+        self._russound = russound
+        self._buf = bytearray()
+        self.closed = russound._loop.create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._buf.clear()
+        self._russound._connection_made(self, transport)
+
+    def data_received(self, data):
+        buf = self._buf
+        buf.extend(data)
+        find = buf.find
+        handle = self._russound._handle_frame
+        start = 0
+        while True:
+            i = find(b'\n', start)
+            if i < 0:
+                break
+            handle(bytes(buf[start:i]))
+            start = i + 1
+        del buf[:start]
+
+    def connection_lost(self, exc):
+        self._russound._connection_lost(exc)
+        if not self.closed.done():
+            self.closed.set_result(None)
 
 
 class Russound:
     """Manages the RIO connection to a Russound device."""
 
-    def __init__(self, loop, host, port=9621):
+    def __init__(self, loop, host, port=9621, coalesce_window=0.0):
         """
         Initialize the Russound object using the event loop, host and port
         provided.
+
+        If coalesce_window is greater than zero, callbacks are deferred by
+        that many seconds and repeated changes to the same variable within
+        the window are delivered once with the latest value. The cache is
+        always updated immediately.
         """
         self._loop = loop
         self._host = host
         self._port = port
-        self._ioloop_future = None
-        self._cmd_queue = asyncio.Queue(loop=loop)
+        self._coalesce_window = coalesce_window
+        self._pending_zone_notifications = collections.OrderedDict()
+        self._pending_source_notifications = collections.OrderedDict()
+        self._flush_handle = None
+        self._transport = None
+        self._protocol = None
+        self._pending = collections.deque()
+        # Cached variable values keyed on (source_id, name) and
+        # (zone_id._key, name)
         self._source_state = {}
         self._zone_state = {}
         self._watched_zones = set()
         self._watched_sources = set()
-        self._zone_callbacks = []
-        self._source_callbacks = []
+        self._zone_callbacks = collections.OrderedDict()
+        self._zone_callbacks_snap = ()
+        self._source_callbacks = collections.OrderedDict()
+        self._source_callbacks_snap = ()
 
     def _retrieve_cached_zone_variable(self, zone_id, name):
         """
@@ -83,9 +240,10 @@ class Russound:
         exception is raised.
         """
         try:
-            s = self._zone_state[zone_id][name.lower()]
-            logger.debug("Zone Cache retrieve %s.%s = %s",
-                         zone_id.device_str(), name, s)
+            s = self._zone_state[(zone_id._key, name)]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Zone Cache retrieve %s.%s = %s",
+                             zone_id._device_str, name, s)
             return s
         except KeyError:
             raise UncachedVariable
@@ -95,12 +253,15 @@ class Russound:
         Stores the current known value of a zone variable into the cache.
         Calls any zone callbacks.
         """
-        zone_state = self._zone_state.setdefault(zone_id, {})
-        name = name.lower()
-        zone_state[name] = value
-        logger.debug("Zone Cache store %s.%s = %s",
-                     zone_id.device_str(), name, value)
-        for callback in self._zone_callbacks:
+        self._zone_state[(zone_id._key, name)] = value
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Zone Cache store %s.%s = %s",
+                         zone_id._device_str, name, value)
+        if self._coalesce_window:
+            self._pending_zone_notifications[(zone_id, name)] = value
+            self._schedule_flush()
+            return
+        for callback in self._zone_callbacks_snap:
             callback(zone_id, name, value)
 
     def _retrieve_cached_source_variable(self, source_id, name):
@@ -110,9 +271,10 @@ class Russound:
         exception is raised.
         """
         try:
-            s = self._source_state[source_id][name.lower()]
-            logger.debug("Source Cache retrieve S[%d].%s = %s",
-                         source_id, name, s)
+            s = self._source_state[(source_id, name)]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Source Cache retrieve S[%d].%s = %s",
+                             source_id, name, s)
             return s
         except KeyError:
             raise UncachedVariable
@@ -122,241 +284,261 @@ class Russound:
         Stores the current known value of a source variable into the cache.
         Calls any source callbacks.
         """
-        source_state = self._source_state.setdefault(source_id, {})
-        name = name.lower()
-        source_state[name] = value
-        logger.debug("Source Cache store S[%d].%s = %s",
-                     source_id, name, value)
-        for callback in self._source_callbacks:
+        self._source_state[(source_id, name)] = value
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Source Cache store S[%d].%s = %s",
+                         source_id, name, value)
+        if self._coalesce_window:
+            self._pending_source_notifications[(source_id, name)] = value
+            self._schedule_flush()
+            return
+        for callback in self._source_callbacks_snap:
             callback(source_id, name, value)
 
+    def _schedule_flush(self):
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                    self._coalesce_window, self._flush_notifications)
+
+    def _flush_notifications(self):
+        """
+        Calls the callbacks for every variable changed since the last flush,
+        passing the latest value of each.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        zones = self._pending_zone_notifications
+        sources = self._pending_source_notifications
+        self._pending_zone_notifications = collections.OrderedDict()
+        self._pending_source_notifications = collections.OrderedDict()
+        for (zone_id, name), value in zones.items():
+            for callback in self._zone_callbacks_snap:
+                callback(zone_id, name, value)
+        for (source_id, name), value in sources.items():
+            for callback in self._source_callbacks_snap:
+                callback(source_id, name, value)
+
     def _process_response(self, res):
-        s = str(res, 'utf-8').strip()
-        ty, payload = s[0], s[2:]
-        if ty == 'E':
-            logger.debug("Device responded with error: %s", payload)
+        s = res.strip()
+        ty, payload = s[0:1], s[2:]
+        if ty == b'E':
+            payload = payload.decode('utf-8', 'replace')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Device responded with error: %s", payload)
             raise CommandException(payload)
 
-        m = _re_response.match(payload)
-        if not m:
+        p = _parse_payload(payload)
+        if p is None:
             return ty, None
 
-        p = m.groupdict()
-        if p['source']:
-            source_id = int(p['source'])
-            self._store_cached_source_variable(
-                    source_id, p['variable'], p['value'])
-        elif p['zone']:
-            zone_id = ZoneID(controller=p['controller'], zone=p['zone'])
-            self._store_cached_zone_variable(zone_id,
-                                             p['variable'],
-                                             p['value'])
-
-        return ty, p['value']
-
-    @asyncio.coroutine
-    def _ioloop(self, reader, writer):
-        queue_future = ensure_future(
-                self._cmd_queue.get(), loop=self._loop)
-        net_future = ensure_future(
-                reader.readline(), loop=self._loop)
+        kind, id_, zone, variable, value = p
+        variable = _norm_wire(variable)
+        if kind == 'S':
+            self._store_cached_source_variable(id_, variable, value)
+        else:
+            try:
+                zone_id = ZoneID.get(zone, id_)
+            except ValueError:
+                # Don't let a malformed frame take the connection down
+                logger.warning(
+                        "Ignoring variable for invalid zone C[%d].Z[%d]",
+                        id_, zone)
+                return ty, value
+            self._store_cached_zone_variable(zone_id, variable, value)
+
+        return ty, value
+
+    def _resolve_pending(self, value=None, exception=None):
+        """
+        Complete the oldest outstanding command with a response.
+        """
+        if not self._pending:
+            return
+        future = self._pending.popleft()
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(value)
+
+    def _handle_frame(self, response):
         try:
-            logger.debug("Starting IO loop")
-            while True:
-                done, pending = yield from asyncio.wait(
-                        [queue_future, net_future],
-                        return_when=asyncio.FIRST_COMPLETED,
-                        loop=self._loop)
-
-                if net_future in done:
-                    response = net_future.result()
-                    try:
-                        self._process_response(response)
-                    except CommandException:
-                        pass
-                    net_future = ensure_future(
-                            reader.readline(), loop=self._loop)
-
-                if queue_future in done:
-                    cmd, future = queue_future.result()
-                    cmd += '\r'
-                    writer.write(bytearray(cmd, 'utf-8'))
-                    yield from writer.drain()
-
-                    queue_future = ensure_future(
-                            self._cmd_queue.get(), loop=self._loop)
-
-                    while True:
-                        response = yield from net_future
-                        net_future = ensure_future(
-                                reader.readline(), loop=self._loop)
-                        try:
-                            ty, value = self._process_response(response)
-                            if ty == 'S':
-                                future.set_result(value)
-                                break
-                        except CommandException as e:
-                            future.set_exception(e)
-                            break
-            logger.debug("IO loop exited")
-        except asyncio.CancelledError:
-            logger.debug("IO loop cancelled")
-            writer.close()
-            queue_future.cancel()
-            net_future.cancel()
-            raise
-        except Exception:
-            logger.exception("Unhandled exception in IO loop")
-            raise
-
-    @asyncio.coroutine
-    def _send_cmd(self, cmd):
-        future = asyncio.Future(loop=self._loop)
-        yield from self._cmd_queue.put((cmd, future))
-        r = yield from future
-        return r
+            ty, value = self._process_response(response)
+            if ty == b'S':
+                self._resolve_pending(value)
+        except CommandException as e:
+            self._resolve_pending(exception=e)
+
+    def _connection_made(self, protocol, transport):
+        self._protocol = protocol
+        self._transport = transport
+
+    def _connection_lost(self, exc):
+        if exc is not None:
+            logger.error("Connection to %s:%s lost: %s",
+                         self._host, self._port, exc)
+        self._transport = None
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(
+                        ConnectionError("Connection to controller lost"))
+
+    async def _send_cmd(self, cmd):
+        if self._transport is None:
+            raise ConnectionError("Not connected to controller")
+        future = self._loop.create_future()
+        self._pending.append(future)
+        self._transport.write(cmd.encode('utf-8') + b'\r')
+        return await future
 
     def add_zone_callback(self, callback):
         """
         Registers a callback to be called whenever a zone variable changes.
         The callback will be passed three arguments: the zone_id, the variable
         name and the variable value.
+
+        The callback must be hashable. Registering the same callback again
+        has no effect; it is still called once per change.
         """
-        self._zone_callbacks.append(callback)
+        self._zone_callbacks[callback] = None
+        self._zone_callbacks_snap = tuple(self._zone_callbacks)
 
     def remove_zone_callback(self, callback):
         """
-        Removes a previously registered zone callback.
+        Removes a previously registered zone callback. Raises ValueError if
+        the callback is not registered.
         """
-        self._zone_callbacks.remove(callback)
+        try:
+            del self._zone_callbacks[callback]
+        except KeyError:
+            raise ValueError("Zone callback is not registered")
+        self._zone_callbacks_snap = tuple(self._zone_callbacks)
 
     def add_source_callback(self, callback):
         """
         Registers a callback to be called whenever a source variable changes.
         The callback will be passed three arguments: the source_id, the
         variable name and the variable value.
+
+        The callback must be hashable. Registering the same callback again
+        has no effect; it is still called once per change.
         """
-        self._source_callbacks.append(callback)
+        self._source_callbacks[callback] = None
+        self._source_callbacks_snap = tuple(self._source_callbacks)
 
-    def remove_source_callback(self, source_id, callback):
+    def remove_source_callback(self, callback):
         """
-        Removes a previously registered zone callback.
+        Removes a previously registered source callback. Raises ValueError
+        if the callback is not registered.
         """
-        self._source_callbacks.remove(callback)
+        try:
+            del self._source_callbacks[callback]
+        except KeyError:
+            raise ValueError("Source callback is not registered")
+        self._source_callbacks_snap = tuple(self._source_callbacks)
 
-    @asyncio.coroutine
-    def connect(self):
+    async def connect(self):
         """
         Connect to the controller and start processing responses.
         """
         logger.info("Connecting to %s:%s", self._host, self._port)
-        reader, writer = yield from asyncio.open_connection(
-                self._host, self._port, loop=self._loop)
-        self._ioloop_future = ensure_future(
-                self._ioloop(reader, writer), loop=self._loop)
+        await self._loop.create_connection(
+                lambda: _RioProtocol(self), self._host, self._port)
         logger.info("Connected")
 
-    @asyncio.coroutine
-    def close(self):
+    async def close(self):
         """
         Disconnect from the controller.
         """
         logger.info("Closing connection to %s:%s", self._host, self._port)
-        self._ioloop_future.cancel()
-        try:
-            yield from self._ioloop_future
-        except asyncio.CancelledError:
-            pass
+        if self._transport is not None:
+            self._transport.close()
+            await self._protocol.closed
+        self._flush_notifications()
 
-    @asyncio.coroutine
-    def set_zone_variable(self, zone_id, variable, value):
+    async def set_zone_variable(self, zone_id, variable, value):
         """
         Set a zone variable to a new value.
         """
-        return self._send_cmd("SET %s.%s=\"%s\"" % (
-            zone_id.device_str(), variable, value))
+        return await self._send_cmd(
+                _cmd_set(zone_id._device_str, variable, value))
 
-    @asyncio.coroutine
-    def get_zone_variable(self, zone_id, variable):
+    async def get_zone_variable(self, zone_id, variable):
         """ Retrieve the current value of a zone variable.  If the variable is
         not found in the local cache then the value is requested from the
         controller.  """
 
         try:
-            return self._retrieve_cached_zone_variable(zone_id, variable)
+            return self._retrieve_cached_zone_variable(
+                    zone_id, _norm(variable))
         except UncachedVariable:
-            return (yield from self._send_cmd("GET %s.%s" % (
-                zone_id.device_str(), variable)))
+            return await self._send_cmd(
+                    _cmd_get(zone_id._device_str, variable))
 
     def get_cached_zone_variable(self, zone_id, variable, default=None):
         """ Retrieve the current value of a zone variable from the cache or
         return the default value if the variable is not present. """
 
         try:
-            return self._retrieve_cached_zone_variable(zone_id, variable)
+            return self._retrieve_cached_zone_variable(
+                    zone_id, _norm(variable))
         except UncachedVariable:
             return default
 
-    @asyncio.coroutine
-    def watch_zone(self, zone_id):
+    async def watch_zone(self, zone_id):
         """ Add a zone to the watchlist.
         Zones on the watchlist will push all
         state changes (and those of the source they are currently connected to)
         back to the client """
-        r = yield from self._send_cmd(
-                "WATCH %s ON" % (zone_id.device_str(), ))
-        self._watched_zones.add(zone_id)
+        r = await self._send_cmd(_cmd_watch_on(zone_id._device_str))
+        self._watched_zones.add(zone_id._key)
         return r
 
-    @asyncio.coroutine
-    def unwatch_zone(self, zone_id):
+    async def unwatch_zone(self, zone_id):
         """ Remove a zone from the watchlist. """
-        self._watched_zones.remove(zone_id)
-        return (yield from
-                self._send_cmd("WATCH %s OFF" % (zone_id.device_str(), )))
+        self._watched_zones.remove(zone_id._key)
+        return await self._send_cmd(_cmd_watch_off(zone_id._device_str))
 
-    @asyncio.coroutine
-    def send_zone_event(self, zone_id, event_name, *args):
+    async def send_zone_event(self, zone_id, event_name, *args):
         """ Send an event to a zone. """
-        cmd = "EVENT %s!%s %s" % (
-                zone_id.device_str(), event_name,
-                " ".join(str(x) for x in args))
-        return (yield from self._send_cmd(cmd))
+        cmd = _cmd_event(zone_id._device_str, event_name,
+                         " ".join(str(x) for x in args))
+        return await self._send_cmd(cmd)
 
-    @asyncio.coroutine
-    def enumerate_zones(self):
+    async def enumerate_zones(self):
         """ Return a list of (zone_id, zone_name) tuples """
         zones = []
         for controller in range(1, 8):
             for zone in range(1, 17):
-                zone_id = ZoneID(zone, controller)
+                zone_id = ZoneID.get(zone, controller)
                 try:
-                    name = yield from self.get_zone_variable(zone_id, 'name')
+                    name = await self.get_zone_variable(zone_id, 'name')
                     if name:
                         zones.append((zone_id, name))
                 except CommandException:
                     break
         return zones
 
-    @asyncio.coroutine
-    def set_source_variable(self, source_id, variable, value):
+    async def set_source_variable(self, source_id, variable, value):
         """ Change the value of a source variable. """
         source_id = int(source_id)
-        return self._send_cmd("SET S[%d].%s=\"%s\"" % (
-            source_id, variable, value))
+        return await self._send_cmd(
+                _cmd_set_source(source_id, variable, value))
 
-    @asyncio.coroutine
-    def get_source_variable(self, source_id, variable):
+    async def get_source_variable(self, source_id, variable):
         """ Get the current value of a source variable. If the variable is not
         in the cache it will be retrieved from the controller. """
 
         source_id = int(source_id)
         try:
             return self._retrieve_cached_source_variable(
-                    source_id, variable)
+                    source_id, _norm(variable))
         except UncachedVariable:
-            return (yield from self._send_cmd("GET S[%d].%s" % (
-                source_id, variable)))
+            return await self._send_cmd(
+                    _cmd_get_source(source_id, variable))
 
     def get_cached_source_variable(self, source_id, variable, default=None):
         """ Get the cached value of a source variable. If the variable is not
@@ -365,35 +547,29 @@ class Russound:
         source_id = int(source_id)
         try:
             return self._retrieve_cached_source_variable(
-                    source_id, variable)
+                    source_id, _norm(variable))
         except UncachedVariable:
             return default
 
-    @asyncio.coroutine
-    def watch_source(self, source_id):
+    async def watch_source(self, source_id):
         """ Add a souce to the watchlist. """
         source_id = int(source_id)
-        r = yield from self._send_cmd(
-                "WATCH S[%d] ON" % (source_id, ))
+        r = await self._send_cmd(_cmd_watch_source_on(source_id))
         self._watched_sources.add(source_id)
         return r
 
-    @asyncio.coroutine
-    def unwatch_source(self, source_id):
+    async def unwatch_source(self, source_id):
         """ Remove a souce from the watchlist. """
         source_id = int(source_id)
         self._watched_sources.remove(source_id)
-        return (yield from
-                self._send_cmd("WATCH S[%d] OFF" % (
-                    source_id, )))
+        return await self._send_cmd(_cmd_watch_source_off(source_id))
 
-    @asyncio.coroutine
-    def enumerate_sources(self):
+    async def enumerate_sources(self):
         """ Return a list of (source_id, source_name) tuples """
         sources = []
         for source_id in range(1, 17):
             try:
-                name = yield from self.get_source_variable(source_id, 'name')
+                name = await self.get_source_variable(source_id, 'name')
                 if name:
                     sources.append((source_id, name))
             except CommandException:
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from russound_rio import Russound
+from russound_rio.rio import _RioProtocol
+
+
+class StubTransport(asyncio.Transport):
+    """ Records what is written instead of sending it anywhere. """
+    def __init__(self, protocol):
+        super().__init__()
+        self._protocol = protocol
+        self.written = []
+
+    def write(self, data):
+        self.written.append(data)
+
+    def close(self):
+        self._protocol.connection_lost(None)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def rio(request, loop):
+    """
+    A Russound object connected to a stub transport. Parametrize
+    indirectly with a dict to pass extra Russound arguments.
+    """
+    rus = Russound(loop, 'localhost', **getattr(request, 'param', {}))
+    protocol = _RioProtocol(rus)
+    protocol.connection_made(StubTransport(protocol))
+    yield loop, rus, protocol
@@ -0,0 +1,42 @@
+import pytest
+
+from russound_rio import ZoneID
+
+
+class _Listener:
+    def __init__(self):
+        self.seen = []
+
+    def on_change(self, *args):
+        self.seen.append(args)
+
+
+def test_remove_bound_method(rio):
+    loop, rus, protocol = rio
+    listener = _Listener()
+    rus.add_zone_callback(listener.on_change)
+    rus.add_source_callback(listener.on_change)
+    protocol.data_received(b'N C[1].Z[1].volume="20"\r\nN S[1].name="A"\r\n')
+    assert listener.seen == [(ZoneID(1), 'volume', '20'), (1, 'name', 'A')]
+
+    rus.remove_zone_callback(listener.on_change)
+    rus.remove_source_callback(listener.on_change)
+    protocol.data_received(b'N C[1].Z[1].volume="21"\r\nN S[1].name="B"\r\n')
+    assert len(listener.seen) == 2
+
+
+def test_add_twice_registers_once(rio):
+    loop, rus, protocol = rio
+    listener = _Listener()
+    rus.add_zone_callback(listener.on_change)
+    rus.add_zone_callback(listener.on_change)
+    protocol.data_received(b'N C[1].Z[1].volume="20"\r\n')
+    assert listener.seen == [(ZoneID(1), 'volume', '20')]
+
+
+def test_remove_unregistered(rio):
+    loop, rus, protocol = rio
+    with pytest.raises(ValueError):
+        rus.remove_zone_callback(print)
+    with pytest.raises(ValueError):
+        rus.remove_source_callback(print)
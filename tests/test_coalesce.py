@@ -0,0 +1,20 @@
+import asyncio
+
+import pytest
+
+from russound_rio import ZoneID
+
+
+@pytest.mark.parametrize('rio', [{'coalesce_window': 0.01}], indirect=True)
+def test_coalesce_zone_notifications(rio):
+    loop, rus, protocol = rio
+    seen = []
+    rus.add_zone_callback(lambda *args: seen.append(args))
+    for volume in (b'20', b'21', b'22'):
+        protocol.data_received(b'N C[1].Z[1].volume="%s"\r\n' % volume)
+    protocol.data_received(b'N C[1].Z[2].volume="5"\r\n')
+    assert seen == []
+    assert rus.get_cached_zone_variable(ZoneID(1), 'volume') == '22'
+    loop.run_until_complete(asyncio.sleep(0.05))
+    assert seen == [(ZoneID(1), 'volume', '22'),
+                    (ZoneID(2), 'volume', '5')]
@@ -0,0 +1,86 @@
+import re
+
+import pytest
+
+from russound_rio.rio import _parse_payload
+
+# The response grammar as the original regex based parser matched it
+_re_response = re.compile(
+        r"(?:(?:S\[(?P<source>\d+)\])|(?:C\[(?P<controller>\d+)\]"
+        r".Z\[(?P<zone>\d+)\]))\.(?P<variable>\S+)=\"(?P<value>.*)\"")
+
+
+def _parse_with_regex(payload):
+    m = _re_response.match(payload.decode('utf-8'))
+    if not m:
+        return None
+    p = m.groupdict()
+    if p['source']:
+        return 'S', int(p['source']), None, p['variable'], p['value']
+    return ('C', int(p['controller']), int(p['zone']),
+            p['variable'], p['value'])
+
+
+def test_parse_source():
+    assert _parse_payload(b'S[2].name="Tuner"') == \
+            ('S', 2, None, b'name', 'Tuner')
+
+
+def test_parse_zone():
+    assert _parse_payload(b'C[1].Z[12].volume="40"') == \
+            ('C', 1, 12, b'volume', '40')
+    assert _parse_payload(b'C[1].Z[3].name=""') == ('C', 1, 3, b'name', '')
+
+
+def test_parse_utf8_value():
+    payload = 'C[1].Z[1].name="Küche"'.encode('utf-8')
+    assert _parse_payload(payload) == ('C', 1, 1, b'name', 'Küche')
+
+
+def test_parse_invalid():
+    assert _parse_payload(b'') is None
+    assert _parse_payload(b'S[x].name="Tuner"') is None
+    assert _parse_payload(b'C[1].Z[3].name="foo') is None
+    assert _parse_payload(b'C[1].Z[3]') is None
+    assert _parse_payload(b'C[-1].Z[1].name="x"') is None
+    assert _parse_payload(b'C[ 1].Z[1].name="x"') is None
+    assert _parse_payload(b'C[1].Z[1_0].name="x"') is None
+    assert _parse_payload(b'S[+1].name="x"') is None
+    assert _parse_payload(b'S[1].a b="x"') is None
+
+
+@pytest.mark.parametrize('payload', [
+    b'S[2].name="Tuner"',
+    b'C[1].Z[12].volume="40"',
+    b'C[1].Z[3].name=""',
+    b'C[1].Z[300].volume="1"',
+    b'C[1]xZ[1].name="x"',
+    'C[1].Z[1].name="Küche"'.encode('utf-8'),
+    b'C[1].Z[1].name="K" ',
+    b'C[1].Z[1].name="K"\t',
+    b'S[1].name="x"junk',
+    b'S[1].name="two words"',
+    b'S[1].name="say "hi""',
+    b'S[1].a="b="c"',
+    b'S[1].a="b c="d"',
+    b'S[1].a b="x"',
+    b'S[1]. name="x"',
+    b'S[1].="x"',
+    b'S[1]name="x"',
+    b'S[1].name=x',
+    b'S[1].name="',
+    b'S[1].name',
+    b'S[x].name="Tuner"',
+    b'S[+1].name="x"',
+    b'C[-1].Z[1].name="x"',
+    b'C[ 1].Z[1].name="x"',
+    b'C[1].Z[1_0].name="x"',
+    b'C[1].Z[3]',
+    b'X[1].name="x"',
+    b'',
+])
+def test_parse_matches_regex(payload):
+    p = _parse_payload(payload)
+    if p is not None:
+        p = p[:3] + (p[3].decode('ascii'),) + p[4:]
+    assert p == _parse_with_regex(payload)
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from russound_rio import CommandException, Russound, ZoneID
+
+
+def _start(loop, coro):
+    """ Start a command and run the loop until it is waiting on a reply. """
+    task = loop.create_task(coro)
+    loop.run_until_complete(asyncio.sleep(0))
+    return task
+
+
+def test_frames_split_across_reads(rio):
+    loop, rus, protocol = rio
+    protocol.data_received(b'N C[1].Z[1].volume="2')
+    assert rus.get_cached_zone_variable(ZoneID(1), 'volume') is None
+    protocol.data_received(b'0"\r\nN S[3].name="Tuner"\r\nN C[1]')
+    assert rus.get_cached_zone_variable(ZoneID(1), 'volume') == '20'
+    assert rus.get_cached_source_variable(3, 'name') == 'Tuner'
+
+
+def test_non_ascii_values(rio):
+    loop, rus, protocol = rio
+    protocol.data_received('N C[1].Z[1].name="Küche"\r\n'.encode('utf-8'))
+    assert rus.get_cached_zone_variable(ZoneID(1), 'name') == 'Küche'
+
+
+def test_connection_lost_fails_pending(rio):
+    loop, rus, protocol = rio
+    task = _start(loop, rus.get_zone_variable(ZoneID(1), 'name'))
+    protocol.connection_lost(None)
+    with pytest.raises(ConnectionError):
+        loop.run_until_complete(task)
+    assert protocol.closed.done()
+
+
+def test_replies_resolve_pending_in_order(rio):
+    loop, rus, protocol = rio
+    first = _start(loop, rus.get_zone_variable(ZoneID(1), 'name'))
+    second = _start(loop, rus.get_zone_variable(ZoneID(2), 'name'))
+    protocol.data_received(b'N C[1].Z[1].volume="20"\r\n')
+    loop.run_until_complete(asyncio.sleep(0))
+    assert not first.done() and not second.done()
+    protocol.data_received(b'S C[1].Z[1].name="x"\r\nE err\r\n')
+    assert loop.run_until_complete(first) == 'x'
+    with pytest.raises(CommandException):
+        loop.run_until_complete(second)
+
+
+def test_invalid_zone_frame_is_skipped(rio):
+    loop, rus, protocol = rio
+    task = _start(loop, rus.get_zone_variable(ZoneID(1), 'name'))
+    protocol.data_received(b'N C[1].Z[300].volume="1"\r\n'
+                           b'S C[1].Z[1].name="x"\r\n')
+    assert loop.run_until_complete(task) == 'x'
+    assert rus.get_cached_zone_variable(ZoneID(1), 'name') == 'x'
+
+
+def test_trailing_whitespace_after_value(rio):
+    loop, rus, protocol = rio
+    task = _start(loop, rus.get_zone_variable(ZoneID(1), 'name'))
+    protocol.data_received(b'S C[1].Z[1].name="K" \r\n')
+    assert loop.run_until_complete(task) == 'K'
+
+
+def test_send_cmd(rio):
+    loop, rus, protocol = rio
+    task = _start(loop, rus.set_zone_variable(ZoneID(2), 'volume', 5))
+    assert protocol.transport.written == [b'SET C[1].Z[2].volume="5"\r']
+    protocol.data_received(b'S\r\n')
+    assert loop.run_until_complete(task) is None
+
+    loop.run_until_complete(rus.close())
+    with pytest.raises(ConnectionError):
+        loop.run_until_complete(rus.get_zone_variable(ZoneID(1), 'name'))
+
+
+def test_uses_loop_passed_in(loop):
+    # The loop given to Russound need not be the current event loop
+    async def handle(reader, writer):
+        await reader.readuntil(b'\r')
+        writer.write(b'S C[1].Z[1].name="Kitchen"\r\n')
+        await writer.drain()
+
+    server = loop.run_until_complete(
+            asyncio.start_server(handle, '127.0.0.1', 0))
+    rus = Russound(loop, '127.0.0.1', server.sockets[0].getsockname()[1])
+
+    async def run():
+        await rus.connect()
+        try:
+            return await rus.get_zone_variable(ZoneID(1), 'name')
+        finally:
+            await rus.close()
+
+    try:
+        assert loop.run_until_complete(run()) == 'Kitchen'
+    finally:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
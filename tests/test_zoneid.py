@@ -1,3 +1,5 @@
+import pytest
+
 from russound_rio import ZoneID
 
 
@@ -6,3 +8,24 @@ def test_device_str():
     assert ZoneID(7).device_str() == "C[1].Z[7]"
     assert ZoneID(1, 2).device_str() == "C[2].Z[1]"
     assert ZoneID(7, 4).device_str() == "C[4].Z[7]"
+
+
+def test_equality():
+    assert ZoneID(1) == ZoneID(1, 1)
+    assert ZoneID(1, 2) != ZoneID(2, 1)
+    assert hash(ZoneID(3, 2)) == hash(ZoneID(3, 2))
+    assert ZoneID(1) != "1:1"
+
+
+def test_get_interned():
+    assert ZoneID.get(5, 2) is ZoneID.get(5, 2)
+    assert ZoneID.get(5, 2) == ZoneID(5, 2)
+
+
+def test_zone_out_of_range():
+    with pytest.raises(ValueError):
+        ZoneID(256)
+    with pytest.raises(ValueError):
+        ZoneID(-1)
+    assert ZoneID(255, 1) != ZoneID(0, 2)
+    assert ZoneID(255, 1)._key != ZoneID(0, 2)._key